@@ -1,14 +1,20 @@
-import array
 import io
+import struct
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Union
 
 import numpy as np
 from PIL import Image
-from pydantic import BaseModel
 
 from kw6 import settings, types
 
+_HEADER_STRUCT = struct.Struct("<17d")
+_N_IMAGE_HEADER_BYTES = settings.N_BYTES_DOUBLE * settings.IM_HDR_SIZE
 
-class CameraHeader(BaseModel):
+
+@dataclass(frozen=True)
+class CameraHeader:
     camera_version: int
     camera_index: types.CAMERA_INDEX
     scale_height: float
@@ -23,82 +29,96 @@ class CameraHeader(BaseModel):
     y0: float
     width: int
     height: int
-    _10xReserved: float
-    _5xWearLeft: float
-    _5xWearRight: float
-
-    class Config:
-        allow_mutation = False
+    # reserved and wear values are often nan, which never compares equal
+    _10xReserved: float = field(compare=False)
+    _5xWearLeft: float = field(compare=False)
+    _5xWearRight: float = field(compare=False)
 
     @staticmethod
     def from_stream_(stream):
-        names = CameraHeader.__fields__.keys()
-        values = array.array("d", stream.read(CameraHeader.byte_size()))
-        parsed_values = []
-        for name, value in zip(names, values):
-            if name in [
-                "camera_version",
-                "scale_height",
-                "scale_length",
-                "xMM",
-                "yMM",
-                "xPixC",
-                "yPixC",
-                "sub_sample",
-                "expoMS",
-                "x0",
-                "y0",
-            ]:
-                parsed_values.append(str(value))
-            elif name in ["camera_index", "width", "height"]:
-                parsed_values.append(int(value))
-            else:
-                parsed_values.append(value)
-        return CameraHeader(**dict(zip(names, parsed_values)))
+        return CameraHeader.from_bytes(stream.read(CameraHeader.byte_size()))
 
     @staticmethod
     def from_bytes(bytes):
-        names = CameraHeader.__fields__.keys()
+        try:
+            values = _HEADER_STRUCT.unpack_from(bytes)
+        except struct.error as error:
+            raise ValueError(f"Unable to parse camera header: {error}") from error
         return CameraHeader(
-            **dict(zip(names, array.array("d", bytes[: CameraHeader.byte_size()])))
+            camera_version=int(values[0]),
+            camera_index=int(values[1]),
+            scale_height=values[2],
+            scale_length=values[3],
+            xMM=values[4],
+            yMM=values[5],
+            xPixC=values[6],
+            yPixC=values[7],
+            sub_sample=values[8],
+            expoMS=values[9],
+            x0=values[10],
+            y0=values[11],
+            width=int(values[12]),
+            height=int(values[13]),
+            _10xReserved=values[14],
+            _5xWearLeft=values[15],
+            _5xWearRight=values[16],
         )
 
     @staticmethod
     def byte_size():
-        names = CameraHeader.__fields__.keys()
-        return settings.N_BYTES_DOUBLE * len(names)
+        return _HEADER_STRUCT.size
 
 
-class Camera(BaseModel):
+@dataclass(frozen=True)
+class Camera:
     header: CameraHeader
-    image: Image.Image
+    image_bytes: Union[bytes, memoryview] = field(repr=False)
+
+    def __post_init__(self):
+        if len(self.image_bytes) != self.header.height * self.header.width:
+            raise ValueError(
+                f"Expected {self.header.height * self.header.width} image bytes "
+                f"but got {len(self.image_bytes)}"
+            )
+
+    @cached_property
+    def image(self) -> Image.Image:
+        return Image.frombuffer(
+            "L",
+            (self.header.width, self.header.height),
+            self.image_bytes,
+            "raw",
+            "L",
+            0,
+            1,
+        )
 
-    class Config:
-        arbitrary_types_allowed = True
-        allow_mutation = False
+    @cached_property
+    def array(self) -> np.ndarray:
+        """Read-only uint8 array that shares memory with the image bytes"""
+        array = np.frombuffer(self.image_bytes, dtype=np.uint8).reshape(
+            self.header.height, self.header.width
+        )
+        array.setflags(write=False)
+        return array
 
     @staticmethod
     def from_stream_(stream):
-        header = CameraHeader.from_stream_(stream)
+        header = CameraHeader.from_bytes(stream.read(_N_IMAGE_HEADER_BYTES))
         return Camera(
             header=header,
-            image=Camera.image_(stream, header),
+            image_bytes=stream.read(header.height * header.width),
         )
 
     @staticmethod
-    def image_(stream, header):
-        n_rows = header.height
-        n_cols = header.width
-        stream.read(
-            settings.N_BYTES_DOUBLE * (settings.IM_HDR_SIZE - len(header.dict()))
-        )
-
-        image_data = np.array(array.array("B", stream.read(n_rows * n_cols))).reshape(
-            n_rows, n_cols
+    def from_bytes(bytes):
+        buffer = memoryview(bytes)
+        header = CameraHeader.from_bytes(buffer)
+        return Camera(
+            header=header,
+            image_bytes=buffer[_N_IMAGE_HEADER_BYTES : Camera.byte_size(header)],
         )
 
-        return Image.fromarray(image_data)
-
     @staticmethod
     def skip_(stream):
         header = CameraHeader.from_stream_(stream)
@@ -107,8 +127,4 @@ class Camera(BaseModel):
 
     @staticmethod
     def byte_size(header):
-        return (
-            CameraHeader.byte_size()
-            + settings.N_BYTES_DOUBLE * (settings.IM_HDR_SIZE - len(header.dict()))
-            + header.height * header.width
-        )
+        return _N_IMAGE_HEADER_BYTES + header.height * header.width
@@ -1,29 +1,60 @@
+import functools
 import re
-import xml.etree.ElementTree as ET
+from pathlib import Path
 
 
-CHILD_TEXT_PATTERN = re.compile(r"""
-kw6Byte = "(?P<byte_position>\d*)"
-kw6Pos = "(?P<kw6_pos>\d*)"
-""")
+INDEX_PATTERN = re.compile(rb'kw6Byte\s*=\s*"(\d+)"\s+kw6Pos\s*=\s*"(\d+)"')
 
 
 def positions(header):
-    root = ET.fromstring(header)
-    positions = [
-        CHILD_TEXT_PATTERN.match(child.text).groupdict()
-        for child in root
-        if child.tag == "kw6Index"
-    ]
+    if isinstance(header, str):
+        header = header.encode()
+
+    indices = INDEX_PATTERN.findall(header)
+    if len(indices) != header.count(b"<kw6Index>"):
+        raise ValueError("Unable to parse all kw6Index entries in header")
 
     return {
-        int(position["kw6_pos"]) // 10: int(position["byte_position"])
-        for position in positions
+        int(kw6_pos) // 10: int(byte_position)
+        for byte_position, kw6_pos in indices
     }
 
 
+def positions_from_path(path):
+    path = Path(path).resolve()
+    stat = path.stat()
+    return dict(cached_positions_from_path(path, stat.st_mtime_ns, stat.st_size))
+
+
+@functools.lru_cache(maxsize=32)
+def cached_positions_from_path(path, mtime_ns, size):
+    return tuple(positions(path.read_bytes()).items())
+
+
 def test_positions():
     from pathlib import Path
     assert positions(
         Path("tests/owlsbtlwear20210409_132606_2011TA.hdr").read_text()
     )[0] == 19
+
+
+def test_positions_malformed():
+    import pytest
+    with pytest.raises(ValueError):
+        positions('<kw6Index>\nkw6Byte = ""\nkw6Pos = "20"\n</kw6Index>')
+
+
+def test_positions_from_path():
+    assert positions_from_path("tests/dynamic.hdr") == positions(
+        Path("tests/dynamic.hdr").read_bytes()
+    )
+    positions_from_path("tests/dynamic.hdr")[0] = 0
+    assert 0 not in positions_from_path("tests/dynamic.hdr")
+
+
+def test_positions_bytes():
+    from pathlib import Path
+    assert positions(Path("tests/dynamic.hdr").read_bytes()) == {
+        2069: 19,
+        2090: 371987,
+    }
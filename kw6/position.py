@@ -1,15 +1,35 @@
 from __future__ import annotations
 
-import array
+import io
+import struct
+from dataclasses import dataclass
 from typing import Any, BinaryIO, Tuple
 
-from pydantic import BaseModel
+import numpy as np
 
-from kw6 import settings, types
+from kw6 import types
 from kw6.camera import Camera
 
+_HEADER_STRUCT = struct.Struct("<6d")
+# n_frame_bytes and frame_index, skipping camera_version
+_FRAME_STRUCT = struct.Struct("<d8xd")
+_HEADER_DTYPE = np.dtype(
+    [
+        (name, "<f8")
+        for name in (
+            "n_frame_bytes",
+            "camera_version",
+            "frame_index",
+            "time",
+            "pulses",
+            "n_active_cameras",
+        )
+    ]
+)
+
 
-class PositionHeader(BaseModel):
+@dataclass(frozen=True)
+class PositionHeader:
     n_frame_bytes: int
     camera_version: str
     frame_index: types.FRAME_INDEX
@@ -17,9 +37,6 @@ class PositionHeader(BaseModel):
     pulses: str
     n_active_cameras: int
 
-    class Config:
-        allow_mutation = False
-
     @staticmethod
     def peek_from_stream(stream: BinaryIO) -> PositionHeader:
         """
@@ -47,6 +64,27 @@ class PositionHeader(BaseModel):
         """
         return PositionHeader.from_bytes(stream.read(PositionHeader.byte_size()))
 
+    @staticmethod
+    def frame_from_bytes(bytes: bytes) -> Tuple[int, types.FRAME_INDEX]:
+        """
+        Parse only the frame size and frame index of a PositionHeader, without
+        parsing the rest of the header.
+
+        Args:
+            bytes: A bytes object containing the PositionHeader data.
+
+        Returns:
+            The number of bytes in the frame and its frame index.
+
+        Raises:
+            ValueError: If there are too few bytes to parse a header.
+        """
+        try:
+            n_frame_bytes, frame_index = _FRAME_STRUCT.unpack_from(bytes)
+        except struct.error as error:
+            raise ValueError(f"Unable to parse position header: {error}") from error
+        return int(n_frame_bytes), int(frame_index)
+
     @staticmethod
     def from_bytes(bytes: bytes) -> PositionHeader:
         """
@@ -57,8 +95,14 @@ class PositionHeader(BaseModel):
 
         Returns:
             A PositionHeader object created from the input bytes.
+
+        Raises:
+            ValueError: If there are too few bytes to parse a header.
         """
-        values = array.array("d", bytes)
+        try:
+            values = _HEADER_STRUCT.unpack_from(bytes)
+        except struct.error as error:
+            raise ValueError(f"Unable to parse position header: {error}") from error
         return PositionHeader(
             n_frame_bytes=int(values[0]),
             camera_version=str(int(values[1])),
@@ -76,36 +120,99 @@ class PositionHeader(BaseModel):
         Returns:
             The size of the PositionHeader in bytes.
         """
-        names = PositionHeader.__fields__.keys()
-        return settings.N_BYTES_DOUBLE * len(names)
+        return _HEADER_STRUCT.size
+
+    @staticmethod
+    def dtype() -> np.dtype:
+        """
+        Get the structured numpy dtype of the raw PositionHeader values.
+
+        Returns:
+            A dtype with one float64 field per PositionHeader field.
+        """
+        return _HEADER_DTYPE
 
 
-class Position(BaseModel):
+@dataclass(frozen=True)
+class Position:
     header: PositionHeader
     cameras: Tuple[Camera, ...]
 
-    class Config:
-        allow_mutation = False
-
     @staticmethod
     def from_stream_(stream: BinaryIO) -> Position:
         """
-        Create a Position object from a binary stream.
+        Create a Position object from a binary stream. All cameras are read with
+        a single read of the rest of the frame.
 
         Args:
             stream: A binary stream to read from.
 
         Returns:
             A Position object created from the read data.
+
+        Raises:
+            ValueError: If the header has an invalid frame size or the stream ends
+                before the end of the frame.
         """
         header = PositionHeader.from_stream_(stream)
+        if header.n_frame_bytes < PositionHeader.byte_size():
+            raise ValueError(f"Unexpected frame size {header.n_frame_bytes}")
+
+        n_camera_bytes = header.n_frame_bytes - PositionHeader.byte_size()
+        camera_bytes = stream.read(n_camera_bytes)
+        if len(camera_bytes) != n_camera_bytes:
+            raise ValueError(
+                f"Expected {n_camera_bytes} bytes of cameras but the stream "
+                f"ended after {len(camera_bytes)}"
+            )
         return Position(
             header=header,
-            cameras=tuple(
-                Camera.from_stream_(stream) for _ in range(header.n_active_cameras)
+            cameras=Position.cameras_from_bytes(header, camera_bytes),
+        )
+
+    @staticmethod
+    def from_bytes(bytes: bytes) -> Position:
+        """
+        Create a Position object from the bytes of a whole frame. The camera images
+        share memory with the input instead of being copied.
+
+        Args:
+            bytes: A bytes-like object containing the frame.
+
+        Returns:
+            A Position object created from the input bytes.
+        """
+        buffer = memoryview(bytes)
+        header = PositionHeader.from_bytes(buffer)
+        return Position(
+            header=header,
+            cameras=Position.cameras_from_bytes(
+                header, buffer[PositionHeader.byte_size() :]
             ),
         )
 
+    @staticmethod
+    def cameras_from_bytes(header: PositionHeader, bytes: bytes) -> Tuple[Camera, ...]:
+        """
+        Create the cameras of a position from the bytes that follow its header.
+
+        Args:
+            header: The PositionHeader of the position.
+            bytes: A bytes-like object containing the cameras.
+
+        Returns:
+            The cameras of the position.
+        """
+        buffer = memoryview(bytes)
+        cameras = []
+        offset = 0
+        for _ in range(header.n_active_cameras):
+            camera = Camera.from_bytes(buffer[offset:])
+            cameras.append(camera)
+            offset += Camera.byte_size(camera.header)
+
+        return tuple(cameras)
+
     @staticmethod
     def skip_(stream: BinaryIO) -> PositionHeader:
         """
@@ -117,6 +224,23 @@ class Position(BaseModel):
         Returns:
             The PositionHeader of the skipped position.
         """
-        header = PositionHeader.peek_from_stream(stream)
-        stream.seek(stream.tell() + header.n_frame_bytes)
+        header = PositionHeader.from_stream_(stream)
+        stream.seek(header.n_frame_bytes - PositionHeader.byte_size(), io.SEEK_CUR)
         return header
+
+
+def test_from_stream_invalid_frame_size():
+    import pytest
+
+    stream = io.BytesIO(_HEADER_STRUCT.pack(8, 1, 0, 0, 0, 0) + bytes(1000))
+    with pytest.raises(ValueError):
+        Position.from_stream_(stream)
+    assert stream.tell() == PositionHeader.byte_size()
+
+
+def test_from_stream_truncated():
+    import pytest
+
+    stream = io.BytesIO(_HEADER_STRUCT.pack(1000, 1, 0, 0, 0, 0) + bytes(100))
+    with pytest.raises(ValueError):
+        Position.from_stream_(stream)
@@ -1,17 +1,75 @@
 from __future__ import annotations
 
+import array
+import bisect
+import collections
+import functools
 import io
+import mmap
+import numbers
+import operator
+import os
+import threading
 from collections.abc import Iterable
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 
-from pydantic import BaseModel
+import numpy as np
 
 from kw6 import header, settings, types
 from kw6.position import Position, PositionHeader
 
 
-class Reader(BaseModel):
+@dataclass
+class VerifiedFrames:
+    """
+    Byte positions and sizes of frames whose headers have been read, shared by
+    the readers of an unmodified file. The frames are kept as parallel arrays
+    sorted by frame index. Frames are only added, never replaced.
+    """
+
+    frame_indices: array.array = field(default_factory=lambda: array.array("q"))
+    byte_positions: array.array = field(default_factory=lambda: array.array("q"))
+    frame_sizes: array.array = field(default_factory=lambda: array.array("q"))
+    lock: Any = field(default_factory=threading.Lock, repr=False)
+
+    def copy(self) -> Tuple[array.array, array.array, array.array]:
+        """
+        Copy the verified frames.
+
+        Returns:
+            The sorted frame indices, byte positions and frame sizes.
+        """
+        with self.lock:
+            return (
+                self.frame_indices[:],
+                self.byte_positions[:],
+                self.frame_sizes[:],
+            )
+
+    def merge_(self, frames: np.ndarray) -> None:
+        """
+        Add frames whose headers have been read, keeping frames that are already
+        verified.
+
+        Args:
+            frames: Rows of frame index, byte position and frame size read from
+                the headers.
+        """
+        with self.lock:
+            merge_frames(
+                self.frame_indices,
+                self.byte_positions,
+                self.frame_sizes,
+                frames,
+                replace=False,
+            )
+
+
+@dataclass
+class Reader:
     """
     Used to iterate over images in a kw6 file.
 
@@ -32,22 +90,55 @@ class Reader(BaseModel):
     """
 
     stream: Any
-    cached_byte_positions: Dict[int, int]
+    _cached_frame_indices: array.array
+    _cached_byte_positions: array.array
+    _cached_n_frame_bytes: array.array
     initial_frame_index: int
     n_bytes: int
     file_version: str
-
-    class Config:
-        arbitrary_types_allowed = True
+    memory_map: Optional[Any] = None
+    drop_cache: bool = False
+    verified_frames: Optional[VerifiedFrames] = field(default=None, repr=False)
+    # frames cached out of order, as flat triples of frame index, byte position
+    # and frame size that are merged into the sorted columns before lookups
+    _pending_frames: array.array = field(
+        default_factory=lambda: array.array("q"), init=False, repr=False
+    )
+    # frames whose headers have been read, as flat triples that are added to the
+    # verified frames in batches
+    _unpublished_frames: array.array = field(
+        default_factory=lambda: array.array("q"), init=False, repr=False
+    )
+    recent_positions: Dict[int, Position] = field(
+        default_factory=collections.OrderedDict, init=False, repr=False
+    )
+    _header_buffer: bytearray = field(
+        default_factory=lambda: bytearray(PositionHeader.byte_size()),
+        init=False,
+        repr=False,
+    )
 
     @staticmethod
-    def from_file_like(file: Any, header_file: Optional[Any] = None) -> "Reader":
+    def from_file_like(
+        file: Any,
+        header_file: Optional[Any] = None,
+        header_positions: Optional[Dict[int, int]] = None,
+        drop_cache: bool = False,
+        verified_frames: Optional[VerifiedFrames] = None,
+    ) -> "Reader":
         """
-        Create a Reader instance from a file-like object.
+        Create a Reader instance from a file-like object. Regular files are memory
+        mapped for zero-copy random access.
 
         Args:
             file: A file-like object containing the kw6 data.
             header_file: An optional file-like object containing header information.
+            header_positions: Optional byte positions by frame index that have
+                already been parsed from a header.
+            drop_cache: Drop pages from the page cache once iteration has passed
+                them. Useful when scanning files larger than memory.
+            verified_frames: Optional frames verified by other readers of the same
+                file. Frames verified by this reader are added to it.
 
         Returns:
             A Reader instance.
@@ -61,34 +152,87 @@ class Reader(BaseModel):
 
         initial_position_header = PositionHeader.from_stream_(file)
 
-        cached_byte_positions = (
-            dict() if header_file is None else header.positions(header_file.read())
+        byte_positions = dict() if header_positions is None else dict(header_positions)
+        if header_file is not None:
+            byte_positions.update(header.positions(header_file.read()))
+        frame_indices, stored_byte_positions, frame_sizes = (
+            (array.array("q"), array.array("q"), array.array("q"))
+            if verified_frames is None
+            else verified_frames.copy()
+        )
+        header_frames = np.array(
+            list(byte_positions.items()), dtype=np.int64
+        ).reshape(-1, 2)
+        # zero marks frames whose header has not been read yet, verified frames
+        # are kept over the header
+        merge_frames(
+            frame_indices,
+            stored_byte_positions,
+            frame_sizes,
+            np.column_stack(
+                [header_frames, np.zeros(len(header_frames), dtype=np.int64)]
+            ),
+            replace=False,
+        )
+        initial_frame = np.array(
+            [
+                (
+                    initial_position_header.frame_index,
+                    settings.N_BYTES_VERSION,
+                    initial_position_header.n_frame_bytes,
+                )
+            ],
+            dtype=np.int64,
         )
-        cached_byte_positions[initial_position_header.frame_index] = (
-            settings.N_BYTES_VERSION
+        merge_frames(
+            frame_indices,
+            stored_byte_positions,
+            frame_sizes,
+            initial_frame,
+            replace=True,
         )
 
         file.seek(0, io.SEEK_END)
         n_bytes = file.tell()
 
+        if verified_frames is not None:
+            verified_frames.merge_(initial_frame)
+
+        memory_map = (
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            if isinstance(file, io.BufferedReader) and isinstance(file.raw, io.FileIO)
+            else None
+        )
+
         return Reader(
             stream=file,
-            cached_byte_positions=cached_byte_positions,
+            _cached_frame_indices=frame_indices,
+            _cached_byte_positions=stored_byte_positions,
+            _cached_n_frame_bytes=frame_sizes,
             initial_frame_index=initial_position_header.frame_index,
             n_bytes=n_bytes,
             file_version=version,
+            memory_map=memory_map,
+            drop_cache=drop_cache,
+            verified_frames=verified_frames,
         )
 
     @staticmethod
     def from_path(
-        path: Union[str, Path], header_path: Optional[Union[str, Path]] = None
+        path: Union[str, Path],
+        header_path: Optional[Union[str, Path]] = None,
+        drop_cache: bool = False,
     ) -> "Reader":
         """
-        Create a Reader instance from a file path.
+        Create a Reader instance from a file path. Parsed header files are cached
+        until they are modified.
 
         Args:
-            path: Path to the kw6 file. Can be a string or Path object.
+            path: Path to the kw6 file. Can be a string or Path object. Frames
+                verified by readers of the same unmodified file are shared.
             header_path: Optional path to the header file. Can be a string or Path object.
+            drop_cache: Drop pages from the page cache once iteration has passed
+                them. Useful when scanning files larger than memory.
 
         Returns:
             A Reader instance.
@@ -96,19 +240,48 @@ class Reader(BaseModel):
         path = Path(path) if isinstance(path, str) else path
         header_path = Path(header_path) if isinstance(header_path, str) else header_path
 
+        file = path.open("rb")
+        stat = os.fstat(file.fileno())
         return Reader.from_file_like(
-            path.open("rb"),
-            None if header_path is None else header_path.open("rb"),
+            file,
+            header_positions=(
+                None if header_path is None else header.positions_from_path(header_path)
+            ),
+            drop_cache=drop_cache,
+            verified_frames=shared_verified_frames(
+                path.resolve(), stat.st_mtime_ns, stat.st_size
+            ),
         )
 
     def __iter__(self) -> Iterable[Position]:
         """Iterate over all positions and cameras in the file"""
-        self.stream.seek(settings.N_BYTES_VERSION)
-        while self.stream.peek(1) != b"":
-            byte_position = self.stream.tell()
-            position = Position.from_stream_(self.stream)
-            self.cached_byte_positions[position.header.frame_index] = byte_position
-            yield position
+        self.advise_(getattr(mmap, "MADV_SEQUENTIAL", None))
+        try:
+            byte_position = settings.N_BYTES_VERSION
+            released_byte_position = 0
+            n_positions = 0
+            while byte_position < self.n_bytes:
+                position = self.position_at_(byte_position)
+                self.cache_byte_position_(
+                    position.header.frame_index,
+                    byte_position,
+                    position.header.n_frame_bytes,
+                )
+                if n_positions % (settings.N_PREFETCH_POSITIONS // 4) == 0:
+                    self.advise_(
+                        getattr(mmap, "MADV_WILLNEED", None),
+                        byte_position,
+                        settings.N_PREFETCH_POSITIONS * position.header.n_frame_bytes,
+                    )
+                    if self.drop_cache:
+                        self.release_(released_byte_position, byte_position)
+                        released_byte_position = byte_position
+                yield position
+                byte_position += position.header.n_frame_bytes
+                n_positions += 1
+        finally:
+            self.advise_(getattr(mmap, "MADV_NORMAL", None))
+            self.publish_frames_()
 
     def __len__(self) -> int:
         """
@@ -127,9 +300,9 @@ class Reader(BaseModel):
             )
             try:
                 max_position = self[assumptuous_max_frame_index]
-                max_byte_position = self.cached_byte_positions[
+                max_byte_position = self.stored_byte_position(
                     max_position.header.frame_index
-                ]
+                )
                 if (
                     self.n_bytes
                     == max_byte_position + max_position.header.n_frame_bytes
@@ -156,18 +329,53 @@ class Reader(BaseModel):
             An estimated number of frames in the file.
         """
         if from_frame_index is None:
-            from_frame_index = max(self.cached_byte_positions.keys())
-
-        from_position = self[from_frame_index]
-        max_byte_position = self.cached_byte_positions[from_frame_index]
-        n_frames = (
-            self.n_bytes - max_byte_position
-        ) / from_position.header.n_frame_bytes
+            self.merge_cache_()
+            from_frame_index = self._cached_frame_indices[-1]
 
-        return int(
-            n_frames + from_position.header.frame_index - self.initial_frame_index
+        max_byte_position = self.stored_byte_position(from_frame_index)
+        n_frames = (self.n_bytes - max_byte_position) / self.n_frame_bytes_(
+            from_frame_index
         )
 
+        return int(n_frames + from_frame_index - self.initial_frame_index)
+
+    def header_table_(self) -> np.ndarray:
+        """
+        Read the position headers of all frames into a single structured array,
+        without creating a Position for each frame. Builds the frame index first.
+
+        Example:
+
+        .. code-block:: python
+
+            table = reader.header_table_()
+            table["frame_index"].max(), table["pulses"]
+
+        Returns:
+            An array with one row per frame and the fields of PositionHeader.dtype.
+
+        Raises:
+            IndexError: If the frames of the file cannot be indexed.
+        """
+        self.build_index_()
+        self.merge_cache_()
+        n_header_bytes = PositionHeader.byte_size()
+        if self.memory_map is not None:
+            # each window is a view of the header bytes starting at one byte, so
+            # indexing the windows copies whole headers without a per byte index
+            rows = np.lib.stride_tricks.sliding_window_view(
+                np.frombuffer(self.memory_map, dtype=np.uint8), n_header_bytes
+            )[np.frombuffer(self._cached_byte_positions, dtype=np.int64)]
+        else:
+            rows = np.frombuffer(
+                b"".join(
+                    bytes(self.read_header_bytes_(byte_position))
+                    for byte_position in self._cached_byte_positions
+                ),
+                dtype=np.uint8,
+            ).reshape(-1, n_header_bytes)
+        return rows.view(PositionHeader.dtype()).reshape(-1)
+
     def __getitem__(
         self, indices_or_slice: Union[int, slice, Iterable[int]]
     ) -> Union[Position, List[Position]]:
@@ -196,16 +404,12 @@ class Reader(BaseModel):
             ValueError: If slice start or stop is None.
             TypeError: If the input type is not supported for indexing.
         """
-        if isinstance(indices_or_slice, int):
-            positions = self.position_(indices_or_slice)
-
-        elif isinstance(indices_or_slice, slice):
+        if isinstance(indices_or_slice, slice):
             if indices_or_slice.start is None or indices_or_slice.stop is None:
                 raise ValueError("NoneType not supported for slice start or stop")
             else:
-                positions = [
-                    self.position_(index)
-                    for index in range(
+                positions = self.positions_(
+                    range(
                         indices_or_slice.start,
                         indices_or_slice.stop,
                         (
@@ -214,16 +418,102 @@ class Reader(BaseModel):
                             else 1
                         ),
                     )
-                ]
+                )
+
+        elif isinstance(indices_or_slice, numbers.Integral):
+            positions = self.position_(operator.index(indices_or_slice))
 
         elif isinstance(indices_or_slice, Iterable):
-            positions = [self.position_(index) for index in indices_or_slice]
+            positions = self.positions_(map(operator.index, indices_or_slice))
 
         else:
             raise TypeError(f"Unindexable type {type(indices_or_slice)}")
 
         return positions
 
+    def positions_(self, frame_indices: Iterable[int]) -> List[Position]:
+        """
+        Retrieve Positions for several frame indices.
+
+        The positions are read in file order, so that each read can continue from
+        the previously cached frame, and are returned in the requested order.
+
+        Args:
+            frame_indices: The frame indices to retrieve.
+
+        Returns:
+            A list of Positions in the same order as the frame indices.
+        """
+        frame_indices = list(frame_indices)
+        sorted_frame_indices = sorted(set(frame_indices))
+        if len(sorted_frame_indices) >= 2:
+            self.prefetch_(sorted_frame_indices)
+
+        positions = dict()
+        previous = None
+        for frame_index in sorted_frame_indices:
+            position = self.recent_positions.get(frame_index)
+            if position is not None:
+                self.recent_positions.move_to_end(frame_index)
+            elif previous is not None:
+                previous_frame_index, previous_byte_position, n_frame_bytes = previous
+                byte_position = previous_byte_position + n_frame_bytes * (
+                    frame_index - previous_frame_index
+                )
+                position = self.predicted_position_(frame_index, byte_position)
+            if position is None:
+                position = self.position_(frame_index)
+            byte_position = self.stored_byte_position(frame_index)
+            positions[frame_index] = position
+            previous = (frame_index, byte_position, position.header.n_frame_bytes)
+
+        return [positions[frame_index] for frame_index in frame_indices]
+
+    def predicted_position_(
+        self, frame_index: types.FRAME_INDEX, byte_position: int
+    ) -> Optional[Position]:
+        """
+        Retrieve a Position at a predicted byte position, checking only the frame
+        index in its header before parsing the frame.
+
+        Args:
+            frame_index: The expected frame index.
+            byte_position: The predicted byte position of the frame.
+
+        Returns:
+            The Position, or None if the frame is not at the predicted byte position.
+        """
+        if byte_position + PositionHeader.byte_size() > self.n_bytes:
+            return None
+        try:
+            n_frame_bytes, header_frame_index = PositionHeader.frame_from_bytes(
+                self.read_header_bytes_(byte_position)
+            )
+            if header_frame_index != frame_index:
+                return None
+            position = self.position_at_(byte_position)
+        except ValueError:
+            return None
+        self.cache_byte_position_(frame_index, byte_position, n_frame_bytes)
+        return self.remember_position_(position)
+
+    def remember_position_(self, position: Position) -> Position:
+        """
+        Keep a retrieved Position among the most recently accessed positions, so
+        that accessing it again returns the same object and its decoded images.
+
+        Args:
+            position: The retrieved Position.
+
+        Returns:
+            The same Position.
+        """
+        self.recent_positions[position.header.frame_index] = position
+        self.recent_positions.move_to_end(position.header.frame_index)
+        while len(self.recent_positions) > settings.N_RECENT_POSITIONS:
+            self.recent_positions.popitem(last=False)
+        return position
+
     def position_(self, frame_index: types.FRAME_INDEX) -> Position:
         """
         Retrieve a Position for a given frame index.
@@ -247,44 +537,377 @@ class Reader(BaseModel):
                 f"index {self.initial_frame_index}"
             )
 
+        if frame_index in self.recent_positions:
+            self.recent_positions.move_to_end(frame_index)
+            return self.recent_positions[frame_index]
+
         step_size_confidence = -1
         for _ in range(10000000):
             from_frame_index = self.closest_stored_frame_index(frame_index)
             if step_size_confidence == -1:
                 to_frame_index = frame_index
             else:
-                to_frame_index = from_frame_index + step_size_confidence
+                to_frame_index = min(
+                    from_frame_index + step_size_confidence, frame_index
+                )
 
             try:
-                byte_position = self.assumptuous_byte_position(
-                    to_frame_index, from_frame_index
-                )
-                self.stream.seek(byte_position)
-                position_header = PositionHeader.from_stream_(self.stream)
-                if position_header.frame_index != to_frame_index:
-                    if step_size_confidence == 1:
-                        raise IndexError(
-                            f"Unexpected frame index {position_header.frame_index} "
-                            f"when moving a single step from {from_frame_index}"
-                        )
-                    step_size_confidence = 1
-                    continue
-                self.cached_byte_positions[position_header.frame_index] = byte_position
+                if step_size_confidence == 1:
+                    byte_position = self.walk_(to_frame_index)
+                else:
+                    byte_position = self.assumptuous_byte_position(
+                        to_frame_index, from_frame_index
+                    )
+                    n_frame_bytes, header_frame_index = PositionHeader.frame_from_bytes(
+                        self.read_header_bytes_(byte_position)
+                    )
+                    if header_frame_index != to_frame_index:
+                        step_size_confidence = 1
+                        continue
+                    self.cache_byte_position_(
+                        to_frame_index, byte_position, n_frame_bytes
+                    )
                 step_size_confidence *= 10
-
-                if position_header.frame_index == frame_index:
-                    self.stream.seek(byte_position)
-                    return Position.from_stream_(self.stream)
-            except Exception:
+            except (IndexError, ValueError):
                 if step_size_confidence == 1:
                     raise IndexError(
                         f"Unable to move a single frame index from "
                         f"{from_frame_index} to {to_frame_index}"
                     )
                 step_size_confidence = 1
+                continue
+
+            if to_frame_index == frame_index:
+                # the frame has been located, so a parsing error means that the
+                # frame itself is corrupt and searching again will not help
+                try:
+                    position = self.position_at_(byte_position)
+                except ValueError as error:
+                    raise IndexError(
+                        f"Unable to read frame index {frame_index}: {error}"
+                    ) from error
+                return self.remember_position_(position)
 
         raise IndexError(f"Unable to find {frame_index}")
 
+    def advise_(
+        self, option: Optional[int], byte_position: int = 0, n_bytes: int = 0
+    ) -> None:
+        """
+        Hint the kernel about how the memory mapped file will be accessed. Does
+        nothing if the file is not memory mapped or the option is not available on
+        the platform.
+
+        Args:
+            option: One of the mmap.MADV_* constants, or None if it is unavailable.
+            byte_position: The start of the hinted range.
+            n_bytes: The length of the hinted range, zero for the rest of the file.
+        """
+        if self.memory_map is not None and option is not None:
+            start = byte_position - byte_position % mmap.PAGESIZE
+            end = (
+                self.n_bytes
+                if n_bytes == 0
+                else min(byte_position + n_bytes, self.n_bytes)
+            )
+            if end > start:
+                self.memory_map.madvise(option, start, end - start)
+
+    def release_(self, from_byte_position: int, to_byte_position: int) -> None:
+        """
+        Drop the whole pages of a byte range from the memory map and the page
+        cache. Pages are read from the file again if they are accessed later.
+
+        Args:
+            from_byte_position: The start of the range.
+            to_byte_position: The end of the range, exclusive.
+        """
+        start = -(-from_byte_position // mmap.PAGESIZE) * mmap.PAGESIZE
+        end = to_byte_position - to_byte_position % mmap.PAGESIZE
+        if end <= start:
+            return
+
+        self.advise_(getattr(mmap, "MADV_DONTNEED", None), start, end - start)
+        if hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(
+                    self.stream.fileno(), start, end - start, os.POSIX_FADV_DONTNEED
+                )
+            except (AttributeError, OSError, io.UnsupportedOperation):
+                pass
+
+    def prefetch_(self, frame_indices: List[types.FRAME_INDEX]) -> None:
+        """
+        Hint the kernel to read ahead the estimated byte ranges of sorted frame
+        indices, extrapolated from the closest stored frame index. Dense indices are
+        hinted as a single span, while scattered indices are hinted one frame at a
+        time so that the kernel can read them in parallel without reading the frames
+        in between. Does nothing if the file is not memory mapped or the ranges
+        cannot be estimated.
+
+        Args:
+            frame_indices: Sorted frame indices that are about to be read.
+        """
+        if (
+            self.memory_map is None
+            or len(frame_indices) == 0
+            or frame_indices[0] < self.initial_frame_index
+        ):
+            return
+
+        closest_frame_index = self.closest_stored_frame_index(frame_indices[0])
+        byte_position = self.stored_byte_position(closest_frame_index)
+        try:
+            n_frame_bytes = self.n_frame_bytes_(closest_frame_index)
+        except (IndexError, ValueError):
+            return
+
+        option = getattr(mmap, "MADV_WILLNEED", None)
+        n_span_frames = frame_indices[-1] - closest_frame_index + 1
+        if n_span_frames <= 2 * len(frame_indices):
+            self.advise_(option, byte_position, n_span_frames * n_frame_bytes)
+        else:
+            for frame_index in frame_indices:
+                self.advise_(
+                    option,
+                    byte_position + (frame_index - closest_frame_index) * n_frame_bytes,
+                    n_frame_bytes,
+                )
+
+    def read_(self, byte_position: int, n_bytes: int) -> Union[bytes, memoryview]:
+        """
+        Read bytes from the kw6 file. Returns a zero-copy view if the file is
+        memory mapped.
+
+        Args:
+            byte_position: The byte position to read from.
+            n_bytes: The number of bytes to read.
+
+        Returns:
+            The read bytes, fewer than n_bytes if the end of the file is reached.
+        """
+        if self.memory_map is not None:
+            return memoryview(self.memory_map)[byte_position : byte_position + n_bytes]
+        else:
+            self.stream.seek(byte_position)
+            return self.stream.read(n_bytes)
+
+    def read_header_bytes_(self, byte_position: int) -> Union[bytes, memoryview]:
+        """
+        Read the bytes of the PositionHeader at a given byte position. Streams that
+        are not memory mapped are read into a reused buffer, so the returned bytes
+        are only valid until the next call.
+
+        Args:
+            byte_position: The byte position of the PositionHeader.
+
+        Returns:
+            The header bytes, fewer than a full header if the end of the file is
+            reached.
+        """
+        if self.memory_map is not None:
+            return self.read_(byte_position, PositionHeader.byte_size())
+        else:
+            self.stream.seek(byte_position)
+            n_bytes = self.stream.readinto(self._header_buffer)
+            return memoryview(self._header_buffer)[:n_bytes]
+
+    def position_at_(self, byte_position: int) -> Position:
+        """
+        Read the Position that starts at a given byte position.
+
+        Args:
+            byte_position: The byte position of the Position.
+
+        Returns:
+            The Position read from the byte position.
+
+        Raises:
+            ValueError: If the header or frame cannot be parsed.
+        """
+        n_frame_bytes, _ = PositionHeader.frame_from_bytes(
+            self.read_header_bytes_(byte_position)
+        )
+        if n_frame_bytes < PositionHeader.byte_size():
+            raise ValueError(
+                f"Unexpected frame size {n_frame_bytes} at byte position "
+                f"{byte_position}"
+            )
+        return Position.from_bytes(self.read_(byte_position, n_frame_bytes))
+
+    def walk_(self, frame_index: types.FRAME_INDEX) -> int:
+        """
+        Walk header by header from the closest stored frame index to the given frame
+        index, storing the byte position of every visited frame. Only the frame size
+        and frame index are read from each header.
+
+        Args:
+            frame_index: The target frame index.
+
+        Returns:
+            The byte position of the target frame.
+
+        Raises:
+            IndexError: If a header has an unexpected frame index or the walk
+                        reaches the end of the file.
+        """
+        walk_frame_index = self.closest_stored_frame_index(frame_index)
+        byte_position = self.stored_byte_position(walk_frame_index)
+        while True:
+            if byte_position >= self.n_bytes:
+                raise IndexError(
+                    f"Reached the end of the file when walking to frame index "
+                    f"{frame_index}"
+                )
+            n_frame_bytes, header_frame_index = PositionHeader.frame_from_bytes(
+                self.read_header_bytes_(byte_position)
+            )
+            if header_frame_index != walk_frame_index:
+                raise IndexError(
+                    f"Unexpected frame index {header_frame_index} when walking "
+                    f"to {walk_frame_index}"
+                )
+            self.cache_byte_position_(walk_frame_index, byte_position, n_frame_bytes)
+            if walk_frame_index == frame_index:
+                return byte_position
+            byte_position += n_frame_bytes
+            walk_frame_index += 1
+
+    def build_index_(self) -> None:
+        """
+        Store the byte position and size of every frame in the file, so that later
+        lookups need no search. Every frame header is checked before its frame is
+        stored. In memory mapped files where every frame has the size of the first
+        frame, all headers are checked at once, other files are walked header by
+        header.
+
+        Raises:
+            IndexError: If a header has an unexpected frame index or size. The
+                        frames before it are still stored.
+        """
+        n_frame_bytes = self.n_frame_bytes_(self.initial_frame_index)
+        if n_frame_bytes >= PositionHeader.byte_size():
+            n_frames, remainder = divmod(
+                self.n_bytes - settings.N_BYTES_VERSION, n_frame_bytes
+            )
+            if remainder == 0 and self.is_constant_stride_(n_frames, n_frame_bytes):
+                first_frame_index = self.initial_frame_index
+                self.store_index_(
+                    array.array(
+                        "q", range(first_frame_index, first_frame_index + n_frames)
+                    ),
+                    array.array(
+                        "q",
+                        range(settings.N_BYTES_VERSION, self.n_bytes, n_frame_bytes),
+                    ),
+                    array.array("q", [n_frame_bytes]) * n_frames,
+                )
+                return
+
+        frame_indices = array.array("q")
+        byte_positions = array.array("q")
+        frame_sizes = array.array("q")
+        byte_position = settings.N_BYTES_VERSION
+        try:
+            while byte_position < self.n_bytes:
+                n_frame_bytes, frame_index = PositionHeader.frame_from_bytes(
+                    self.read_header_bytes_(byte_position)
+                )
+                expected_frame_index = self.initial_frame_index + len(frame_indices)
+                if frame_index != expected_frame_index:
+                    raise IndexError(
+                        f"Unexpected frame index {frame_index} when indexing "
+                        f"{expected_frame_index}"
+                    )
+                if (
+                    n_frame_bytes < PositionHeader.byte_size()
+                    or byte_position + n_frame_bytes > self.n_bytes
+                ):
+                    raise IndexError(
+                        f"Frame index {frame_index} has an invalid size "
+                        f"{n_frame_bytes}"
+                    )
+                frame_indices.append(frame_index)
+                byte_positions.append(byte_position)
+                frame_sizes.append(n_frame_bytes)
+                byte_position += n_frame_bytes
+        except ValueError as error:
+            raise IndexError(
+                f"Unable to read frame header at byte position {byte_position}"
+            ) from error
+        finally:
+            self.store_index_(frame_indices, byte_positions, frame_sizes)
+
+    def is_constant_stride_(self, n_frames: int, n_frame_bytes: int) -> bool:
+        """
+        Check every frame header of a memory mapped file, as if every frame had the
+        same size, in a single strided view of the map.
+
+        Args:
+            n_frames: The number of frames implied by the frame size.
+            n_frame_bytes: The size of the first frame.
+
+        Returns:
+            True if every header has the frame size and the next frame index, False
+            if any does not or the file is not memory mapped.
+        """
+        if self.memory_map is None:
+            return False
+
+        headers = np.ndarray(
+            (n_frames,),
+            dtype=PositionHeader.dtype(),
+            buffer=self.memory_map,
+            offset=settings.N_BYTES_VERSION,
+            strides=(n_frame_bytes,),
+        )
+        try:
+            return bool(
+                np.all(headers["n_frame_bytes"] == n_frame_bytes)
+                and np.array_equal(
+                    headers["frame_index"],
+                    np.arange(
+                        self.initial_frame_index, self.initial_frame_index + n_frames
+                    ),
+                )
+            )
+        finally:
+            # release the export of the map so that it can still be closed
+            del headers
+
+    def store_index_(
+        self,
+        frame_indices: array.array,
+        byte_positions: array.array,
+        frame_sizes: array.array,
+    ) -> None:
+        """
+        Replace the stored frames from the initial frame index up to the last of the
+        given consecutive frame indices, whose headers have been checked.
+
+        Args:
+            frame_indices: Consecutive frame indices from the initial frame index.
+            byte_positions: The byte positions of the frames.
+            frame_sizes: The sizes of the frames.
+        """
+        if len(frame_indices) == 0:
+            return
+        self.merge_cache_()
+        end = bisect.bisect_right(self._cached_frame_indices, frame_indices[-1])
+        self._cached_frame_indices[:end] = frame_indices
+        self._cached_byte_positions[:end] = byte_positions
+        self._cached_n_frame_bytes[:end] = frame_sizes
+        if self.verified_frames is not None:
+            self.publish_frames_()
+            self.verified_frames.merge_(
+                np.column_stack(
+                    [
+                        np.frombuffer(column, dtype=np.int64)
+                        for column in (frame_indices, byte_positions, frame_sizes)
+                    ]
+                )
+            )
+
     def assumptuous_byte_position(
         self,
         frame_index: types.FRAME_INDEX,
@@ -303,12 +926,9 @@ class Reader(BaseModel):
         Raises:
             IndexError: If the calculated byte position is negative or greater than the file size.
         """
-        self.stream.seek(self.cached_byte_positions[from_frame_index])
-        from_byte_position = self.stream.tell()
-        from_position_header = PositionHeader.from_stream_(self.stream)
-
+        from_byte_position = self.stored_byte_position(from_frame_index)
         byte_position = (
-            from_position_header.n_frame_bytes * (frame_index - from_frame_index)
+            self.n_frame_bytes_(from_frame_index) * (frame_index - from_frame_index)
             + from_byte_position
         )
         if byte_position < 0:
@@ -333,17 +953,308 @@ class Reader(BaseModel):
 
         Returns:
             The closest stored frame index.
+
+        Raises:
+            ValueError: If no stored frame index is less than or equal to the given one.
         """
-        earlier_frame_indices = [
-            cached_frame_index
-            for cached_frame_index in self.cached_byte_positions.keys()
-            if cached_frame_index <= frame_index
-        ]
-        return max(earlier_frame_indices)
+        self.merge_cache_()
+        index = bisect.bisect_right(self._cached_frame_indices, frame_index)
+        if index == 0:
+            raise ValueError(f"No stored frame index before {frame_index}")
+        return self._cached_frame_indices[index - 1]
+
+    @property
+    def cached_byte_positions(self) -> Mapping[int, int]:
+        """
+        Byte positions of the stored frames by frame index.
+
+        Returns:
+            A read-only mapping from frame index to byte position.
+        """
+        self.merge_cache_()
+        return MappingProxyType(
+            dict(zip(self._cached_frame_indices, self._cached_byte_positions))
+        )
+
+    def merge_cache_(self) -> None:
+        """
+        Merge the frames cached out of order into the sorted frame columns, in a
+        single pass over the columns.
+        """
+        if len(self._pending_frames) > 0:
+            frames = np.frombuffer(self._pending_frames, dtype=np.int64).copy()
+            del self._pending_frames[:]
+            merge_frames(
+                self._cached_frame_indices,
+                self._cached_byte_positions,
+                self._cached_n_frame_bytes,
+                frames.reshape(-1, 3),
+                replace=True,
+            )
+
+    def stored_index(self, frame_index: types.FRAME_INDEX) -> int:
+        """
+        Find where a stored frame index is kept in the cached arrays.
+
+        Args:
+            frame_index: A stored frame index.
+
+        Returns:
+            The index of the frame in the cached arrays.
+
+        Raises:
+            KeyError: If the frame index is not stored.
+        """
+        self.merge_cache_()
+        index = bisect.bisect_left(self._cached_frame_indices, frame_index)
+        if (
+            index == len(self._cached_frame_indices)
+            or self._cached_frame_indices[index] != frame_index
+        ):
+            raise KeyError(frame_index)
+        return index
+
+    def stored_byte_position(self, frame_index: types.FRAME_INDEX) -> int:
+        """
+        Get the byte position of a stored frame index.
+
+        Args:
+            frame_index: A stored frame index.
+
+        Returns:
+            The byte position of the frame in the stream.
+
+        Raises:
+            KeyError: If the frame index is not stored.
+        """
+        return self._cached_byte_positions[self.stored_index(frame_index)]
+
+    def cache_byte_position_(
+        self,
+        frame_index: types.FRAME_INDEX,
+        byte_position: int,
+        n_frame_bytes: Optional[int] = None,
+    ) -> None:
+        """
+        Store the byte position of a frame index. The frame indices, byte positions
+        and frame sizes are kept as parallel arrays sorted by frame index. Stored
+        frames are updated in place and frames after the last stored frame are
+        appended, other frames are merged in a batch before the next lookup.
+
+        Args:
+            frame_index: The frame index to store.
+            byte_position: The byte position of the frame in the stream.
+            n_frame_bytes: The size of the frame, if its header has been read at the
+                byte position. Such frames are shared with other readers of the file.
+        """
+        frame_indices = self._cached_frame_indices
+        frame_size = 0 if n_frame_bytes is None else n_frame_bytes
+        index = (
+            bisect.bisect_left(frame_indices, frame_index)
+            if len(self._pending_frames) == 0
+            else None
+        )
+        if index is None or (
+            index < len(frame_indices) and frame_indices[index] != frame_index
+        ):
+            self._pending_frames.extend((frame_index, byte_position, frame_size))
+        elif index == len(frame_indices):
+            frame_indices.append(frame_index)
+            self._cached_byte_positions.append(byte_position)
+            self._cached_n_frame_bytes.append(frame_size)
+        elif self._cached_byte_positions[index] != byte_position:
+            self._cached_byte_positions[index] = byte_position
+            self._cached_n_frame_bytes[index] = frame_size
+        elif n_frame_bytes is not None:
+            self._cached_n_frame_bytes[index] = n_frame_bytes
+
+        if n_frame_bytes is not None:
+            self.verify_frame_(frame_index, byte_position, n_frame_bytes)
+
+    def n_frame_bytes_(self, frame_index: types.FRAME_INDEX) -> int:
+        """
+        Get the size of a stored frame, reading its header only the first time.
+
+        Args:
+            frame_index: A stored frame index.
+
+        Returns:
+            The number of bytes in the frame.
+
+        Raises:
+            IndexError: If the stored byte position does not point to the frame.
+        """
+        index = self.stored_index(frame_index)
+        if self._cached_n_frame_bytes[index] == 0:
+            n_frame_bytes, header_frame_index = PositionHeader.frame_from_bytes(
+                self.read_header_bytes_(self._cached_byte_positions[index])
+            )
+            if header_frame_index != frame_index:
+                raise IndexError(
+                    f"Stored byte position of frame index {frame_index} points to "
+                    f"frame index {header_frame_index}"
+                )
+            self._cached_n_frame_bytes[index] = n_frame_bytes
+            self.verify_frame_(
+                frame_index, self._cached_byte_positions[index], n_frame_bytes
+            )
+        return self._cached_n_frame_bytes[index]
+
+    def verify_frame_(
+        self, frame_index: types.FRAME_INDEX, byte_position: int, n_frame_bytes: int
+    ) -> None:
+        """
+        Queue a frame whose header has been read at a byte position, to be added to
+        the verified frames shared with other readers of the file.
+
+        Args:
+            frame_index: The frame index read from the header.
+            byte_position: The byte position of the header.
+            n_frame_bytes: The frame size read from the header.
+        """
+        if self.verified_frames is not None:
+            unpublished_frames = self._unpublished_frames
+            unpublished_frames.extend((frame_index, byte_position, n_frame_bytes))
+            if len(unpublished_frames) >= 3 * settings.N_UNPUBLISHED_FRAMES:
+                self.publish_frames_()
+
+    def publish_frames_(self) -> None:
+        """
+        Add the queued frames to the verified frames, taking the lock once for the
+        whole batch. Frames are published when the queue is full, after iterating
+        or indexing the file and when the reader is closed.
+        """
+        if self.verified_frames is not None and len(self._unpublished_frames) > 0:
+            frames = np.frombuffer(self._unpublished_frames, dtype=np.int64).copy()
+            del self._unpublished_frames[:]
+            self.verified_frames.merge_(frames.reshape(-1, 3))
+
+    def close(self) -> None:
+        """
+        Close the stream and the memory map. Positions that still share memory
+        with the map keep it alive until they are garbage collected.
+        """
+        self.publish_frames_()
+        self.stream.close()
+        self.recent_positions.clear()
+        if self.memory_map is not None:
+            try:
+                self.memory_map.close()
+            except BufferError:
+                # positions outside the reader still share memory with the map,
+                # which is released when the last of them is garbage collected
+                pass
+            self.memory_map = None
+
+    def __enter__(self) -> "Reader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def __del__(self):
         """Close the stream when the Reader object is deleted."""
-        self.stream.close()
+        if getattr(self, "stream", None) is not None:
+            self.close()
+
+
+def merge_frames(
+    frame_indices: array.array,
+    byte_positions: array.array,
+    frame_sizes: array.array,
+    frames: np.ndarray,
+    replace: bool,
+) -> None:
+    """
+    Merge frames into sorted frame columns in place, with a single pass over the
+    columns instead of one insert per frame.
+
+    Args:
+        frame_indices: Sorted frame indices.
+        byte_positions: The byte positions of the frames.
+        frame_sizes: The sizes of the frames, zero if unknown.
+        frames: Rows of frame index, byte position and frame size, zero if
+            unknown. Rows are applied in order, as if stored one at a time.
+        replace: Replace frames that are already in the columns. A known frame
+            size is kept if the byte position does not change.
+    """
+    if len(frames) == 0:
+        return
+
+    frames = frames[np.argsort(frames[:, 0], kind="stable")]
+    rows = np.arange(len(frames))
+    first_of_frame = np.append(True, frames[1:, 0] != frames[:-1, 0])
+    last_of_frame = np.append(first_of_frame[1:], True)
+    # a row with a new byte position forgets the frame size of the rows before it
+    new_position = np.append(True, frames[1:, 1] != frames[:-1, 1])
+    run_start = np.maximum.accumulate(np.where(first_of_frame | new_position, rows, 0))
+    frame_start = np.maximum.accumulate(np.where(first_of_frame, rows, 0))
+    last_known = np.maximum.accumulate(np.where(frames[:, 2] != 0, rows, -1))
+    sizes = np.where(last_known >= run_start, frames[last_known, 2], 0)
+    # frames with one byte position in all rows can keep a stored frame size
+    unmoved = (run_start == frame_start)[last_of_frame]
+    frames = np.stack([frames[:, 0], frames[:, 1], sizes], axis=1)[last_of_frame]
+    new_frame_indices, new_byte_positions, new_frame_sizes = frames.T
+
+    if len(frame_indices) == 0 or new_frame_indices[0] > frame_indices[-1]:
+        frame_indices.frombytes(new_frame_indices.tobytes())
+        byte_positions.frombytes(new_byte_positions.tobytes())
+        frame_sizes.frombytes(new_frame_sizes.tobytes())
+        return
+
+    targets = (frame_indices, byte_positions, frame_sizes)
+    columns = [np.frombuffer(column, dtype=np.int64) for column in targets]
+    insert_at = np.searchsorted(columns[0], new_frame_indices)
+    exists = insert_at < len(columns[0])
+    exists[exists] = columns[0][insert_at[exists]] == new_frame_indices[exists]
+
+    if replace:
+        existing = insert_at[exists]
+        moved = columns[1][existing] != new_byte_positions[exists]
+        moved |= ~unmoved[exists]
+        columns[1][existing] = new_byte_positions[exists]
+        columns[2][existing] = np.where(
+            moved | (new_frame_sizes[exists] != 0),
+            new_frame_sizes[exists],
+            columns[2][existing],
+        )
+
+    added = ~exists
+    merged = (
+        [
+            np.insert(column, insert_at[added], new_values[added])
+            for column, new_values in zip(
+                columns, (new_frame_indices, new_byte_positions, new_frame_sizes)
+            )
+        ]
+        if added.any()
+        else []
+    )
+    # the arrays cannot be resized while numpy views of them exist
+    del columns
+    for target, column in zip(targets, merged):
+        target[:] = array.array("q", column.tobytes())
+
+
+@functools.lru_cache(maxsize=32)
+def shared_verified_frames(path: Path, mtime_ns: int, size: int) -> VerifiedFrames:
+    """
+    Get the verified frames shared by the readers of a file. The modification time
+    and size are part of the key, so a changed file gets new verified frames.
+
+    The verified frames of the last 32 files are kept for the lifetime of the
+    process, also after their readers are closed, using 24 bytes per frame. Call
+    ``shared_verified_frames.cache_clear()`` to release them.
+
+    Args:
+        path: The resolved path of the file.
+        mtime_ns: The modification time of the file in nanoseconds.
+        size: The size of the file in bytes.
+
+    Returns:
+        The verified frames of the file.
+    """
+    return VerifiedFrames()
 
 
 def test_file_not_found():
@@ -353,6 +1264,46 @@ def test_file_not_found():
         Reader.from_path("fail").version
 
 
+def test_close():
+    with Reader.from_path("tests/constant.kw6") as reader:
+        reader[reader.initial_frame_index + 1]
+    assert reader.stream.closed
+    assert reader.memory_map is None
+
+    with Reader.from_path("tests/constant.kw6") as reader:
+        memory_map = reader.memory_map
+        reader[reader.initial_frame_index + 1]
+    assert memory_map.closed
+
+    with Reader.from_path("tests/constant.kw6") as reader:
+        position = reader[reader.initial_frame_index]
+    assert reader.stream.closed
+    assert reader.memory_map is None
+    assert position.cameras[0].array.shape == (
+        position.cameras[0].header.height,
+        position.cameras[0].header.width,
+    )
+
+
+def test_iter_drop_cache(monkeypatch):
+    released = []
+    release_ = Reader.release_
+
+    def spy_release_(self, from_byte_position, to_byte_position):
+        released.append((from_byte_position, to_byte_position))
+        release_(self, from_byte_position, to_byte_position)
+
+    monkeypatch.setattr(Reader, "release_", spy_release_)
+    # buffered files are memory mapped, unbuffered files are read as streams
+    for file in [open("tests/constant.kw6", "rb"), open("tests/constant.kw6", "rb", 0)]:
+        released.clear()
+        for _ in Reader.from_file_like(file, drop_cache=True):
+            pass
+        assert len(released) >= 2 and released[0][0] == 0
+        for (_, previous_to), (from_, to) in zip(released, released[1:]):
+            assert from_ == previous_to < to
+
+
 def test_iter():
     import pytest
 
@@ -369,6 +1320,38 @@ def test_indexing():
     assert reader[10].header.frame_index == 10
     assert reader[10:21][-1].header.frame_index == 20
     assert reader[[11, 5, 9]][1].header.frame_index == 5
+    assert [
+        position.header.frame_index for position in reader[[9, 5, 9, 7]]
+    ] == [9, 5, 9, 7]
+
+
+def test_indexing_numpy():
+    import numpy as np
+
+    reader = Reader.from_path("tests/constant.kw6")
+    frame_index = reader.initial_frame_index + 3
+    assert reader[np.int64(frame_index)].header.frame_index == frame_index
+    assert [
+        position.header.frame_index
+        for position in reader[np.array([frame_index, frame_index - 1])]
+    ] == [frame_index, frame_index - 1]
+
+
+def test_indexing_in_memory():
+    reader = Reader.from_file_like(
+        io.BufferedReader(io.BytesIO(Path("tests/dynamic.kw6").read_bytes()))
+    )
+    assert reader.memory_map is None
+    assert reader[2090] == Reader.from_path("tests/dynamic.kw6")[2090]
+
+
+def test_camera_array():
+    import numpy as np
+
+    camera = Reader.from_path("tests/constant.kw6")[10].cameras[0]
+    assert camera.array.shape == (camera.header.height, camera.header.width)
+    assert not camera.array.flags.writeable
+    assert np.array_equal(camera.array, np.asarray(camera.image))
 
 
 def test_indexing_dynamic():
@@ -385,6 +1368,144 @@ def test_indexing_dynamic_header():
     assert reader[2100].header.frame_index == 2100
 
 
+def test_closest_stored_frame_index():
+    reader = Reader.from_file_like(
+        open("tests/dynamic.kw6", "rb"), open("tests/dynamic.hdr", "rb")
+    )
+    assert reader.closest_stored_frame_index(2069) == 2069
+    assert reader.closest_stored_frame_index(2089) == 2069
+    assert reader.closest_stored_frame_index(2100) == 2090
+
+
+def test_walk():
+    reader = Reader.from_file_like(open("tests/dynamic.kw6", "rb"))
+    byte_position = reader.walk_(2075)
+    assert list(reader._cached_frame_indices) == list(range(2069, 2076))
+    assert reader.stored_byte_position(2075) == byte_position
+    reader.stream.seek(byte_position)
+    assert PositionHeader.from_stream_(reader.stream).frame_index == 2075
+
+
+def test_walk_before_stored_frame():
+    import pytest
+
+    byte_position = Reader.from_file_like(open("tests/dynamic.kw6", "rb")).walk_(2080)
+    reader = Reader.from_file_like(
+        open("tests/dynamic.kw6", "rb"), header_positions={2080: byte_position}
+    )
+    reader.walk_(2075)
+    assert reader.cached_byte_positions[2080] == byte_position
+    assert list(reader._cached_frame_indices) == [*range(2069, 2076), 2080]
+    assert list(reader._cached_byte_positions) == sorted(reader._cached_byte_positions)
+    with pytest.raises(TypeError):
+        reader.cached_byte_positions[2080] = 0
+
+
+def test_build_index():
+    for path in ["tests/constant.kw6", "tests/dynamic.kw6"]:
+        reader = Reader.from_file_like(open(path, "rb"))
+        reader.build_index_()
+        byte_position = settings.N_BYTES_VERSION
+        for position in Reader.from_file_like(open(path, "rb")):
+            assert reader.stored_byte_position(position.header.frame_index) == (
+                byte_position
+            )
+            byte_position += position.header.n_frame_bytes
+        assert len(reader._cached_frame_indices) == len(reader)
+
+
+def test_build_index_constant_first_and_last(tmp_path):
+    import pytest
+
+    source = Reader.from_path("tests/constant.kw6")
+    n_frame_bytes = source.n_frame_bytes_(source.initial_frame_index)
+    data = bytearray(Path("tests/constant.kw6").read_bytes())
+    # overwrite the frame index of a middle frame
+    byte_position = settings.N_BYTES_VERSION + 10 * n_frame_bytes
+    data[byte_position + 16 : byte_position + 24] = array.array("d", [0.0]).tobytes()
+    path = tmp_path / "middle_corrupt.kw6"
+    path.write_bytes(bytes(data))
+
+    reader = Reader.from_path(path)
+    with pytest.raises(IndexError):
+        reader.build_index_()
+    assert list(reader._cached_frame_indices) == list(
+        range(reader.initial_frame_index, reader.initial_frame_index + 10)
+    )
+
+
+def test_build_index_corrupt():
+    import pytest
+
+    reader = Reader.from_file_like(open("tests/constant_corrupt.kw6", "rb"))
+    with pytest.raises(IndexError):
+        reader.build_index_()
+    assert len(reader._cached_frame_indices) == 51
+
+
+def test_header_table():
+    import io
+
+    path = "tests/dynamic.kw6"
+    headers = [position.header for position in Reader.from_path(path)]
+    for reader in [
+        Reader.from_file_like(open(path, "rb")),
+        Reader.from_file_like(io.BufferedReader(io.BytesIO(Path(path).read_bytes()))),
+    ]:
+        table = reader.header_table_()
+        assert table["frame_index"].tolist() == [
+            header.frame_index for header in headers
+        ]
+        assert table["n_frame_bytes"].tolist() == [
+            header.n_frame_bytes for header in headers
+        ]
+
+
+def test_n_frame_bytes():
+    reader = Reader.from_file_like(
+        open("tests/dynamic.kw6", "rb"), open("tests/dynamic.hdr", "rb")
+    )
+    index = reader.stored_index(2090)
+    assert reader._cached_n_frame_bytes[index] == 0
+    assert reader.n_frame_bytes_(2090) == reader[2090].header.n_frame_bytes
+    assert reader._cached_n_frame_bytes[index] == reader[2090].header.n_frame_bytes
+
+
+def test_shared_verified_frames():
+    shared_verified_frames.cache_clear()
+    with Reader.from_path("tests/dynamic.kw6") as reader:
+        byte_position = reader.walk_(2075)
+    assert Reader.from_path("tests/dynamic.kw6").stored_byte_position(2075) == (
+        byte_position
+    )
+    assert 2090 in Reader.from_path(
+        "tests/dynamic.kw6", "tests/dynamic.hdr"
+    )._cached_frame_indices
+    assert 2090 not in Reader.from_path("tests/dynamic.kw6")._cached_frame_indices
+
+
+def test_shared_verified_frames_wrong_header(tmp_path):
+    header_path = tmp_path / "dynamic.hdr"
+    header_path.write_bytes(
+        Path("tests/dynamic.hdr").read_bytes().replace(b'"371987"', b'"371990"')
+    )
+    shared_verified_frames.cache_clear()
+    reader = Reader.from_path("tests/dynamic.kw6", header_path)
+    assert reader.stored_byte_position(2090) == 371990
+    assert Reader.from_path("tests/dynamic.kw6")[2095].header.frame_index == 2095
+
+
+def test_shared_verified_frames_kept():
+    verified_frames = VerifiedFrames()
+    verified_frames.merge_(np.array([[3, 219, 100], [1, 19, 100]]))
+    verified_frames.merge_(np.array([[1, 20, 100], [2, 119, 100]]))
+    assert [list(column) for column in verified_frames.copy()] == [
+        [1, 2, 3],
+        [19, 119, 219],
+        [100, 100, 100],
+    ]
+
+
 def test_length():
     reader = Reader.from_path("tests/constant.kw6")
 
@@ -455,6 +1576,15 @@ def test_last_twice():
     reader[2163]
 
 
+def test_recent_positions():
+    reader = Reader.from_path("tests/constant.kw6")
+    frame_index = reader.initial_frame_index + 3
+    assert reader[frame_index] is reader[frame_index]
+    assert reader[[frame_index]][0] is reader[frame_index]
+    reader[frame_index : frame_index + 2 * settings.N_RECENT_POSITIONS]
+    assert len(reader.recent_positions) == settings.N_RECENT_POSITIONS
+
+
 def test_read_too_far_dynamic():
     import pytest
 
@@ -464,6 +1594,23 @@ def test_read_too_far_dynamic():
         reader[10000]
 
 
+def test_read_corrupt_frame(monkeypatch):
+    import pytest
+
+    reader = Reader.from_path("tests/constant_corrupt.kw6")
+    header_reads = []
+    read_header_bytes_ = Reader.read_header_bytes_
+
+    def spy_read_header_bytes_(self, byte_position):
+        header_reads.append(byte_position)
+        return read_header_bytes_(self, byte_position)
+
+    monkeypatch.setattr(Reader, "read_header_bytes_", spy_read_header_bytes_)
+    with pytest.raises(IndexError, match="Unable to read frame index 52"):
+        reader[52]
+    assert len(header_reads) <= 10
+
+
 def test_read_too_far_constant():
     import pytest
 
@@ -3,3 +3,6 @@
 N_BYTES_VERSION = 19
 N_BYTES_DOUBLE = 8
 IM_HDR_SIZE = 34
+N_PREFETCH_POSITIONS = 64
+N_RECENT_POSITIONS = 16
+N_UNPUBLISHED_FRAMES = 1024